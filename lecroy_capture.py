@@ -47,7 +47,7 @@ CONNECTION_TYPE = "USB"
 # ── Ethernet settings (used when CONNECTION_TYPE = "ETHERNET") ────────────── #
 SCOPE_IP        = "1[<This is IP address placeholder>]"   # IP address of the oscilloscope
 SCOPE_PORT      = 0                # 0 = auto  |  1861 = VICP  |  5025 = SCPI raw
-                                   # (auto tries VXI-11 first, then HiSLIP, then raw)
+                                   # (auto tries HiSLIP first, then VXI-11, then raw)
 USERNAME        = ""               # HTTP/web auth — leave "" if not required
 PASSWORD        = ""               # HTTP/web auth — leave "" if not required
 
@@ -73,11 +73,16 @@ DISPLAY_COLOR   = "WHITE"          # Background color of the captured screenshot
 #  Do NOT edit below this line unless you know what you are doing.
 # ═══════════════════════════════════════════════════════════════════════════ #
 
+import atexit
 import os
+import re
 import sys
 import time
 import ipaddress
+import select
 import socket
+import struct
+from typing import Callable
 
 # ── Pillow ────────────────────────────────────────────────────────────────
 try:
@@ -97,6 +102,14 @@ except ImportError:
     print("        Run:  pip install pyvisa pyvisa-py")
     sys.exit(1)
 
+# ── Validated display color (DISPLAY_COLOR is fixed for the whole run) ────
+_COLOR = DISPLAY_COLOR.upper()
+if _COLOR not in ("WHITE", "BLACK"):
+    print(f"[WARN] Unknown DISPLAY_COLOR '{DISPLAY_COLOR}' — defaulting to WHITE.")
+    _COLOR = "WHITE"
+
+_RM_CACHE: dict[str, pyvisa.ResourceManager] = {}   # backend -> open RM
+
 def _open_rm() -> pyvisa.ResourceManager:
     """
     Return the best available VISA ResourceManager.
@@ -106,14 +119,22 @@ def _open_rm() -> pyvisa.ResourceManager:
          — required to see devices that show as IVI in Windows Device Manager.
       2. pyvisa-py pure-Python backend (@py)
          — fallback when no system VISA is installed.
+
+    The manager is opened once per process and reused by every caller;
+    it is closed at interpreter exit, so callers must NOT close it.
     """
+    for backend in ("", "@py"):
+        if backend in _RM_CACHE:
+            return _RM_CACHE[backend]
     try:
+        backend = ""
         rm = pyvisa.ResourceManager()   # system VISA (NI / Keysight / IVI)
-        rm.list_resources()             # test — raises if backend is unusable
-        return rm
-    except Exception:
-        pass
-    return pyvisa.ResourceManager("@py")
+    except (OSError, ValueError):       # no / unloadable system VISA library
+        backend = "@py"
+        rm = pyvisa.ResourceManager("@py")
+    _RM_CACHE[backend] = rm
+    atexit.register(rm.close)
+    return rm
 
 # ══════════════════════════ Path utilities ══════════════════════════════════
 
@@ -166,36 +187,65 @@ def subnet_info(scope_ip: str) -> None:
 
 
 def check_tcp_reachable(ip: str, timeout: int = 3) -> bool:
-    """Try common scope ports; return True if any responds."""
-    for port in (1861, 5025, 80):
-        try:
-            with socket.create_connection((ip, port), timeout=timeout):
-                return True
-        except OSError:
-            continue
-    return False
+    """
+    Try common scope ports concurrently; return True as soon as any responds.
+    Non-blocking connect() on every port, then one select() wait — a
+    socket turning writable with SO_ERROR == 0 has completed its handshake.
+    Worst-case latency is one *timeout*, not one per port.
+    """
+    family  = socket.AF_INET6 if ipaddress.ip_address(ip).version == 6 else socket.AF_INET
+    pending = []
+    try:
+        for port in (1861, 5025, 80):
+            s = socket.socket(family, socket.SOCK_STREAM)
+            pending.append(s)
+            s.setblocking(False)
+            s.connect_ex((ip, port))   # returns at once (EINPROGRESS)
+
+        deadline = time.monotonic() + timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            # Windows reports a failed connect via the exception set
+            _, writable, failed = select.select([], pending, pending, remaining)
+            for s in set(writable) | set(failed):
+                if s in writable and s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    return True
+                pending.remove(s)
+                s.close()
+        return False
+    except OSError:
+        return False
+    finally:
+        for s in pending:
+            s.close()
 
 
 # ══════════════════════════ VISA resource helpers ═══════════════════════════
 
+_ETH_OPEN_TIMEOUT_MS = 2000   # per-candidate VISA open timeout on the LAN path
+
 def build_ethernet_resources(ip: str, port: int) -> list:
     """
     Return VISA resource strings to try in order.
-    VXI-11 (inst0) and HiSLIP (hislip0) are the two standard LAN protocols.
+    HiSLIP (hislip0) and VXI-11 (inst0) are the two standard LAN protocols.
+    HiSLIP is tried first — a single TCP stream with large message framing,
+    much faster than VXI-11's per-read RPC calls on block transfers.
     A raw SOCKET resource is also included as last-resort fallback.
     """
     resources = []
     if port in (0, 1861, 5025):
         resources += [
-            f"TCPIP::{ip}::inst0::INSTR",    # VXI-11
             f"TCPIP::{ip}::hislip0::INSTR",  # HiSLIP (newer scopes)
+            f"TCPIP::{ip}::inst0::INSTR",    # VXI-11
         ]
         p = 5025 if port in (0, 5025) else 1861
         resources.append(f"TCPIP::{ip}::{p}::SOCKET")  # raw SCPI socket
     else:
         resources = [
-            f"TCPIP::{ip}::inst0::INSTR",
             f"TCPIP::{ip}::hislip0::INSTR",
+            f"TCPIP::{ip}::inst0::INSTR",
             f"TCPIP::{ip}::{port}::SOCKET",
         ]
     return resources
@@ -232,38 +282,50 @@ def find_usb_resource(rm: pyvisa.ResourceManager) -> str | None:
 
 # ══════════════════════════ Vendor detection ════════════════════════════════
 
+# Manufacturer token (as found in *IDN?) -> short vendor tag
+_VENDOR_TAGS = {
+    "LECROY"   : "LECROY",
+    "TELEDYNE" : "LECROY",
+    "TEKTRONIX": "TEKTRONIX",
+    "KEYSIGHT" : "KEYSIGHT",
+    "AGILENT"  : "KEYSIGHT",
+    "HEWLETT"  : "KEYSIGHT",
+    "RIGOL"    : "RIGOL",
+    "SIGLENT"  : "SIGLENT",
+    "ROHDE"    : "RNS",
+    "R&S"      : "RNS",
+}
+_VENDOR_RE = re.compile("|".join(re.escape(t) for t in _VENDOR_TAGS), re.IGNORECASE)
+
 def detect_vendor(idn: str) -> str:
     """
     Parse *IDN? response and return a short vendor tag.
     Format: <manufacturer>,<model>,<serial>,<firmware>
+    One regex scan; the leftmost token wins, i.e. the manufacturer field.
     """
-    idn_upper = idn.upper()
-    if "LECROY" in idn_upper or "TELEDYNE" in idn_upper:
-        return "LECROY"
-    if "TEKTRONIX" in idn_upper or "TEK" in idn_upper:
-        return "TEKTRONIX"
-    if "KEYSIGHT" in idn_upper or "AGILENT" in idn_upper or "HEWLETT" in idn_upper:
-        return "KEYSIGHT"
-    if "RIGOL" in idn_upper:
-        return "RIGOL"
-    if "SIGLENT" in idn_upper:
-        return "SIGLENT"
-    if "ROHDE" in idn_upper or "ROHDE&SCHWARZ" in idn_upper or "R&S" in idn_upper:
-        return "RNS"
-    return "UNKNOWN"
+    m = _VENDOR_RE.search(idn)
+    return _VENDOR_TAGS[m.group(0).upper()] if m else "UNKNOWN"
 
 
 # ══════════════════════════ SCPI screen capture ═════════════════════════════
 
-def scpi_capture(resource_str: str, save_path: str, timeout_ms: int) -> bool:
+_VISA_CHUNK_SIZE = 4 * 1024 * 1024   # bytes per VISA read for binary screen dumps
+
+def scpi_capture(resource_str: str, save_path: str, timeout_ms: int,
+                 open_timeout_ms: int | None = None,
+                 pre_detected_vendor: str | None = None) -> bool:
     """
     Open *resource_str* via VISA, identify the instrument, issue the
     appropriate SCPI screen-dump command, receive the binary image, and
     save it to *save_path*.
 
+    *open_timeout_ms* bounds only the session open (defaults to
+    *timeout_ms*) so an unreachable LAN candidate fails fast.
+    *pre_detected_vendor* (e.g. from vicp_capture) skips the *IDN? query.
+
     Returns True on success, False on any failure.
     """
-    rm = _open_rm()   # system VISA (NI/IVI) preferred; falls back to pyvisa-py
+    rm = _open_rm()   # cached; system VISA (NI/IVI) preferred, else pyvisa-py
 
     print(f"\n[VISA] Opening: {resource_str}")
 
@@ -275,10 +337,13 @@ def scpi_capture(resource_str: str, save_path: str, timeout_ms: int) -> bool:
     elif resource_str.endswith("::INST"):
         candidates.append(resource_str[:-len("INST")] + "INSTR")
 
+    if open_timeout_ms is None:
+        open_timeout_ms = timeout_ms
+
     scope = None
     for attempt in candidates:
         try:
-            scope = rm.open_resource(attempt, open_timeout=timeout_ms)
+            scope = rm.open_resource(attempt, open_timeout=open_timeout_ms)
             if attempt != resource_str:
                 print(f"[VISA] Opened with adjusted suffix: {attempt}")
             break
@@ -287,24 +352,30 @@ def scpi_capture(resource_str: str, save_path: str, timeout_ms: int) -> bool:
 
     if scope is None:
         print(f"[VISA] Cannot open resource (tried: {candidates})")
-        rm.close()
         return False
 
     try:
         scope.timeout = timeout_ms
+        # Large read chunk so a ~750 kB BMP/PNG arrives in one or two transfers
+        # instead of dozens of 20 kB round-trips (pyvisa default).
+        scope.chunk_size = _VISA_CHUNK_SIZE
 
         # ── Set termination for text queries ──────────────────────────────
         scope.read_termination  = "\n"
         scope.write_termination = "\n"
 
         # ── Identify instrument ───────────────────────────────────────────
-        try:
-            idn = scope.query("*IDN?").strip()
-        except Exception:
-            idn = "(no IDN response)"
-        vendor = detect_vendor(idn)
-        print(f"[VISA] Instrument : {idn}")
-        print(f"[VISA] Vendor tag : {vendor}")
+        if pre_detected_vendor:
+            vendor = pre_detected_vendor
+            print(f"[VISA] Vendor tag : {vendor}  (already identified — *IDN? skipped)")
+        else:
+            try:
+                idn = scope.query("*IDN?").strip()
+            except Exception:
+                idn = "(no IDN response)"
+            vendor = detect_vendor(idn)
+            print(f"[VISA] Instrument : {idn}")
+            print(f"[VISA] Vendor tag : {vendor}")
 
         # ── Issue screen-dump SCPI command(s) by vendor ───────────────────
         image_data = _screen_dump(scope, vendor)
@@ -315,15 +386,13 @@ def scpi_capture(resource_str: str, save_path: str, timeout_ms: int) -> bool:
             #    retry with raw VICP socket directly on port 1861.
             if vendor == "LECROY" and "TCPIP::" in resource_str.upper():
                 ip = resource_str.split("::")[1]
-                color = DISPLAY_COLOR.upper() if DISPLAY_COLOR.upper() in ("WHITE","BLACK") else "WHITE"
                 print(f"[VICP] VXI-11 image transfer failed — falling back to raw VICP on {ip}:1861")
                 try:
                     scope.close()
                 except Exception:
                     pass
-                rm.close()
                 try:
-                    image_data = _dump_lecroy_vicp_raw(ip, color, timeout_ms // 1000)
+                    image_data = _dump_lecroy_vicp_raw(ip, _COLOR, timeout_ms // 1000)
                 except Exception as exc:
                     print(f"[VICP] Raw VICP also failed: {exc}")
                     return False
@@ -331,11 +400,15 @@ def scpi_capture(resource_str: str, save_path: str, timeout_ms: int) -> bool:
                     print(f"[VICP] Raw VICP returned too little data ({len(image_data) if image_data else 0} bytes).")
                     return False
                 image_data = _strip_ieee_block(image_data)
+                if image_data is None:
+                    return False
                 _save_image(image_data, save_path)
                 return True
             return False
 
         image_data = _strip_ieee_block(image_data)
+        if image_data is None:
+            return False
         _save_image(image_data, save_path)
         return True
 
@@ -347,7 +420,6 @@ def scpi_capture(resource_str: str, save_path: str, timeout_ms: int) -> bool:
             scope.close()
         except Exception:
             pass
-        rm.close()
 
 
 def _screen_dump(scope, vendor: str) -> bytes | None:
@@ -355,25 +427,20 @@ def _screen_dump(scope, vendor: str) -> bytes | None:
     Dispatch to the correct vendor SCPI command set and return raw image bytes.
     Falls back to generic methods if vendor is unknown.
     """
-    color = DISPLAY_COLOR.upper()
-    if color not in ("WHITE", "BLACK"):
-        print(f"[WARN] Unknown DISPLAY_COLOR '{DISPLAY_COLOR}' — defaulting to WHITE.")
-        color = "WHITE"
-
     if vendor == "LECROY":
-        return _dump_lecroy(scope, color)
+        return _dump_lecroy(scope, _COLOR)
     if vendor == "TEKTRONIX":
-        return _dump_tektronix(scope, color)
+        return _dump_tektronix(scope, _COLOR)
     if vendor in ("KEYSIGHT", "AGILENT"):
-        return _dump_keysight(scope, color)
+        return _dump_keysight(scope, _COLOR)
     if vendor in ("RIGOL", "SIGLENT"):
-        return _dump_rigol(scope, color)
+        return _dump_rigol(scope, _COLOR)
 
     # Unknown vendor — try methods in order
     print("[SCPI] Unknown vendor — trying all capture methods …")
     for fn in (_dump_keysight, _dump_rigol, _dump_lecroy, _dump_tektronix):
         try:
-            data = fn(scope, color)
+            data = fn(scope, _COLOR)
             if data and len(data) > 100:
                 return data
         except Exception:
@@ -384,72 +451,147 @@ def _screen_dump(scope, vendor: str) -> bytes | None:
 # ── Vendor-specific SCPI capture implementations ─────────────────────────
 
 # VICP constants (LeCroy Visual Instrument Control Protocol, port 1861)
-_VICP_HDR   = ">BBBBI"    # op(1) ver(1) seq(1) pad(1) len(4)
-_VICP_HLEN  = 8
+_VICP_HDR   = struct.Struct(">BBBBI")   # op(1) ver(1) seq(1) pad(1) len(4)
+_VICP_HLEN  = _VICP_HDR.size            # 8
 _VICP_SEQ   = [0]
+_VICP_RCVBUF = 4 * 1024 * 1024   # kernel receive buffer — holds a full BMP
+_VICP_RECV_MAX = 262144          # max bytes requested per recv() call
+_VICP_BUF_SIZE = 4_000_000       # initial image buffer — grows if exceeded
+_VICP_DRAIN_SEC = 0.5            # idle gap after a non-EOI frame = end of data
+_VERBOSE    = False               # True = print one diagnostic line per VICP frame
+
+
+class _VicpWriteError(Exception):
+    """The *write* sink given to _vicp_recv() failed (e.g. disk full)."""
 
 def _vicp_next_seq() -> int:
     _VICP_SEQ[0] = (_VICP_SEQ[0] % 255) + 1
     return _VICP_SEQ[0]
 
-def _vicp_send(sock: socket.socket, cmd: str) -> None:
-    import struct
-    payload = cmd.encode("ascii")
-    op      = 0x80 | 0x40 | 0x01   # DATA | REMOTE | EOI
-    hdr     = struct.pack(_VICP_HDR, op, 0x01, _vicp_next_seq(), 0x00, len(payload))
-    sock.sendall(hdr + payload)
+def _vicp_tune_socket(sock: socket.socket) -> None:
+    """
+    Disable Nagle (small VICP control frames go out immediately) and
+    enlarge the receive buffer so the scope never stalls mid-image.
+    """
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _VICP_RCVBUF)
+    except OSError:
+        pass   # OS may cap / refuse the size — default buffer still works
 
-def _vicp_recv(sock: socket.socket) -> bytes:
+def _vicp_send(sock: socket.socket, *cmds: str) -> None:
+    """
+    Send one VICP frame per command.  Several commands are packed into a
+    single sendall() so they leave in one TCP segment; each frame carries
+    EOI, so the scope still parses them one after another, in order.
+    """
+    out = bytearray()
+    op  = 0x80 | 0x40 | 0x01   # DATA | REMOTE | EOI
+    for cmd in cmds:
+        payload = cmd.encode("ascii")
+        out += _VICP_HDR.pack(op, 0x01, _vicp_next_seq(), 0x00, len(payload))
+        out += payload
+    sock.sendall(out)
+
+def _vicp_recv(sock: socket.socket,
+               write: Callable[[memoryview], object] | None = None) -> bytearray:
     """
     Read one or more VICP frames until the EOI flag (bit 0 of op) is set
     OR the scope closes the connection / the socket times out (both are
-    treated as a valid end-of-data condition for LeCroy).
+    treated as a valid end-of-data condition for LeCroy).  If the data
+    opens with an IEEE 488.2 "#N<len>" header, frames are awaited with
+    the full socket timeout until the declared bytes are in.
 
     Op-byte flags:  DATA=0x80  REMOTE=0x40  LOCKOUT=0x20  CLEAR=0x10
                     SRQ=0x08   REQSEND=0x04  EOI=0x01
     Only frames with DATA set contribute to the image payload; any other
     frames (SRQ, etc.) are consumed and discarded.
-    """
-    import struct
 
-    def recv_exact(n: int) -> bytes:
-        buf = bytearray()
-        while len(buf) < n:
-            chunk = sock.recv(n - len(buf))
-            if not chunk:
-                raise ConnectionError(f"VICP: remote closed after {len(buf)}/{n} bytes.")
-            buf.extend(chunk)
-        return bytes(buf)
+    Frames are received with recv_into() straight into one preallocated
+    buffer, which is trimmed in place and returned — no copy of the image.
 
-    image   = bytearray()
+    If *write* is given, each DATA payload is handed to it as soon as it
+    arrives (e.g. a file's write method) and the returned buffer is empty;
+    memory use is then bounded by the largest frame, not the image.  A
+    failing *write* is not end-of-data: it raises _VicpWriteError.
+    """
+    def recv_exact_into(target: memoryview) -> None:
+        n   = len(target)
+        got = 0
+        while got < n:
+            k = sock.recv_into(target[got:], min(n - got, _VICP_RECV_MAX))
+            if not k:
+                raise ConnectionError(f"VICP: remote closed after {got}/{n} bytes.")
+            got += k
+
+    buf     = bytearray(_VICP_BUF_SIZE if write is None else _VICP_RECV_MAX)
+    view    = memoryview(buf)
+    off     = 0                       # end of accumulated image data in buf
+    total   = 0                       # DATA bytes received (kept or written)
+    hdr     = memoryview(bytearray(_VICP_HLEN))
     frame_n = 0
+    expect  = None                    # DATA bytes declared by a #N<len> header
     try:
         while True:
-            raw_hdr = recv_exact(_VICP_HLEN)
-            op, _, _, _, length = struct.unpack(_VICP_HDR, raw_hdr)
+            # Scopes that never set EOI: once a frame has arrived, a quiet
+            # socket for _VICP_DRAIN_SEC ends the message cleanly instead of
+            # waiting out the full socket timeout.  The first header still
+            # gets the whole timeout (that covers the scope's render time),
+            # and so does every frame of a block that is not yet complete —
+            # a mid-transfer stall (e.g. a Wi-Fi retransmit) is not the end.
+            if (frame_n and (expect is None or total >= expect)
+                    and not select.select([sock], [], [], _VICP_DRAIN_SEC)[0]):
+                print(f"[VICP] No more frames (no EOI) after {frame_n} frame(s) — "
+                      f"{total:,} bytes total.", flush=True)
+                break
+            recv_exact_into(hdr)
+            op, _, _, _, length = _VICP_HDR.unpack(hdr)
             is_data = bool(op & 0x80)   # DATA bit
             eoi     = bool(op & 0x01)   # EOI  bit — last frame of message
             if length:
-                payload = recv_exact(length)
+                if off + length > len(buf):
+                    view.release()    # a bytearray can't resize while exported
+                    buf.extend(bytes(max(length, len(buf))))
+                    view = memoryview(buf)
+                # Received past *off*; only committed once the frame is whole.
+                recv_exact_into(view[off : off + length])
                 if is_data:
-                    image.extend(payload)
-                # silently discard SRQ / control frames
+                    if not total:
+                        block = _ieee_block_header(view[off : off + length])
+                        if block:
+                            expect = block[0] + block[1]
+                    total += length
+                    if write is None:
+                        off += length
+                    else:
+                        try:
+                            write(view[:length])
+                        except Exception as exc:
+                            raise _VicpWriteError(f"writing image data failed: {exc}") from exc
+                # silently discard SRQ / control frames (overwritten next frame)
             frame_n += 1
-            print(f"[VICP]   frame {frame_n:3d}: op=0x{op:02X}  len={length:,}  "
-                  f"total={len(image):,}  eoi={eoi}", flush=True)
+            if _VERBOSE:
+                print(f"[VICP]   frame {frame_n:3d}: op=0x{op:02X}  len={length:,}  "
+                      f"total={total:,}  eoi={eoi}", flush=True)
             if eoi:
+                print(f"[VICP] Received {frame_n} frame(s) — {total:,} bytes total.")
                 break
+    except _VicpWriteError:
+        view.release()
+        raise
     except (ConnectionError, OSError):
         # scope closed the TCP connection — treat accumulated data as complete
         print(f"[VICP] Connection closed by scope after {frame_n} frame(s) — "
-              f"{len(image):,} bytes total.", flush=True)
+              f"{total:,} bytes total.", flush=True)
     except Exception as exc:  # socket.timeout or anything else
         print(f"[VICP] Receive ended ({exc}) after {frame_n} frame(s) — "
-              f"{len(image):,} bytes total.", flush=True)
-    return bytes(image)
+              f"{total:,} bytes total.", flush=True)
+    view.release()
+    del buf[off:]                     # trim unused capacity in place
+    return buf
 
 
-def _dump_lecroy_vicp_raw(ip: str, color: str, timeout_sec: int) -> bytes:
+def _dump_lecroy_vicp_raw(ip: str, color: str, timeout_sec: int) -> bytearray:
     """
     Capture LeCroy screen directly via raw VICP TCP socket on port 1861.
     This bypasses pyvisa/VXI-11 entirely — required because LeCroy sends
@@ -458,38 +600,48 @@ def _dump_lecroy_vicp_raw(ip: str, color: str, timeout_sec: int) -> bytes:
     print(f"[VICP] Connecting directly to {ip}:1861 (raw VICP) …")
     sock = socket.create_connection((ip, 1861), timeout=timeout_sec)
     sock.settimeout(timeout_sec)
+    _vicp_tune_socket(sock)
     try:
-        _vicp_send(sock, f"HCSU DEV,BMP,FORMAT,PORTRAIT,BCKG,{color},DEST,REMOTE,PORT,NET")
-        time.sleep(0.5)
-        _vicp_send(sock, "SCREEN_DUMP")
-        time.sleep(4.0)   # allow scope time to render full BMP before first frame arrives
+        _vicp_send(sock,
+                   f"HCSU DEV,BMP,FORMAT,PORTRAIT,BCKG,{color},DEST,REMOTE,PORT,NET",
+                   "SCREEN_DUMP")
+        # No fixed render delay: the first recv blocks (up to timeout_sec)
+        # until the scope emits its first VICP header.
         data = _vicp_recv(sock)
     finally:
         sock.close()
     return data
 
 
-def vicp_capture(ip: str, save_path: str, timeout_sec: int) -> bool:
+def vicp_capture(ip: str, save_path: str, timeout_sec: int) -> tuple[bool, str]:
     """
     Full LeCroy capture path using raw VICP on port 1861 — no VISA / VXI-11.
     Sends *IDN? first to confirm the target is a LeCroy scope, then sends
     HCSU + SCREEN_DUMP and receives the BMP image in one or more VICP frames.
-    Returns True on success, False on any failure.
+    Returns (success, vendor) — vendor is the tag from *IDN? ("" if the
+    scope never answered) so a VISA fallback can skip re-identifying it.
     """
-    color = DISPLAY_COLOR.upper() if DISPLAY_COLOR.upper() in ("WHITE", "BLACK") else "WHITE"
+    # HCSU always asks for BMP.  If a .bmp is wanted there is nothing to
+    # convert, so DATA frames are streamed to "<save_path>.part" (renamed
+    # on success) instead of buffering the whole image in memory.
+    stream    = os.path.splitext(save_path)[1].lower() == ".bmp"
+    part_path = save_path + ".part"
+    written   = 0
+    missing   = 0
 
     print(f"[VICP] Trying native VICP on {ip}:1861 …")
     try:
         sock = socket.create_connection((ip, 1861), timeout=timeout_sec)
         sock.settimeout(timeout_sec)
+        _vicp_tune_socket(sock)
     except OSError as exc:
         print(f"[VICP] Cannot connect to {ip}:1861 — {exc}")
-        return False
+        return False, ""
 
+    vendor = ""
     try:
         # ── Step 1: identify instrument ───────────────────────────────────
         _vicp_send(sock, "*IDN?")
-        time.sleep(0.2)
         idn_raw = _vicp_recv(sock)
         idn     = idn_raw.decode("ascii", errors="replace").strip()
         vendor  = detect_vendor(idn)
@@ -498,30 +650,58 @@ def vicp_capture(ip: str, save_path: str, timeout_sec: int) -> bool:
 
         if vendor != "LECROY":
             print(f"[VICP] Not a LeCroy — skipping VICP path.")
-            return False
+            return False, vendor
 
-        # ── Step 2: configure and trigger screen dump ─────────────────────
-        _vicp_send(sock, f"HCSU DEV,BMP,FORMAT,PORTRAIT,BCKG,{color},DEST,REMOTE,PORT,NET")
-        time.sleep(0.5)
-        _vicp_send(sock, "SCREEN_DUMP")
-        time.sleep(4.0)   # scope needs time to render full BMP
+        # ── Step 2: configure and trigger screen dump (one TCP write) ─────
+        _vicp_send(sock,
+                   f"HCSU DEV,BMP,FORMAT,PORTRAIT,BCKG,{_COLOR},DEST,REMOTE,PORT,NET",
+                   "SCREEN_DUMP")
 
         # ── Step 3: receive multi-frame VICP image response ───────────────
-        image_data = _vicp_recv(sock)
+        # The socket timeout (timeout_sec) covers the scope's render time —
+        # the first recv returns as soon as the first frame is emitted.
+        if stream:
+            os.makedirs(os.path.dirname(os.path.abspath(save_path)), exist_ok=True)
+            with open(part_path, "wb") as fh:
+                writer, remaining = _ieee_block_writer(fh.write)
+                _vicp_recv(sock, writer)
+                written = fh.tell()
+                missing = remaining()
+        else:
+            image_data = _vicp_recv(sock)
 
     except Exception as exc:
         print(f"[VICP] Error during capture: {exc}")
-        return False
+        _remove_quietly(part_path)
+        return False, vendor
     finally:
         sock.close()
 
+    if stream:
+        if missing:
+            print(f"[VICP] Image incomplete — {written:,} bytes received, "
+                  f"{missing:,} more declared by the block header.")
+            _remove_quietly(part_path)
+            return False, vendor
+        if written < 100:
+            print(f"[VICP] Image data too small ({written} bytes).")
+            _remove_quietly(part_path)
+            return False, vendor
+        os.replace(part_path, save_path)
+        with open(save_path, "rb") as fh:
+            _, width, height = _sniff_image(fh.read(26))
+        _print_saved(save_path, width, height)
+        return True, vendor
+
     if not image_data or len(image_data) < 100:
         print(f"[VICP] Image data too small ({len(image_data) if image_data else 0} bytes).")
-        return False
+        return False, vendor
 
     image_data = _strip_ieee_block(image_data)
+    if image_data is None:
+        return False, vendor
     _save_image(image_data, save_path)
-    return True
+    return True, vendor
 
 
 def _dump_lecroy(scope, color: str = "WHITE") -> bytes:
@@ -530,11 +710,11 @@ def _dump_lecroy(scope, color: str = "WHITE") -> bytes:
     HCSU configures hardcopy: BMP, background color, send to remote (bus).
     SCREEN_DUMP triggers the transfer.
     color: "WHITE" or "BLACK"
+    No fixed sleeps: HCSU only sets registers, and read_raw() blocks (up to
+    scope.timeout) until the rendered image starts arriving.
     """
     scope.write(f"HCSU DEV,BMP,FORMAT,PORTRAIT,BCKG,{color},DEST,REMOTE,PORT,NET")
-    time.sleep(0.3)
     scope.write("SCREEN_DUMP")
-    time.sleep(1.5)
     scope.read_termination = None        # binary transfer — no text terminator
     data = scope.read_raw()
     return data
@@ -551,9 +731,13 @@ def _dump_tektronix(scope, color: str = "WHITE") -> bytes:
     scope.write("HARDcopy:PORT GPIB")   # route output to bus
     scope.write("HARDcopy:FORMat BMP")
     scope.write(f"HARDcopy:INKSaver {ink}")
-    time.sleep(0.2)
+    # A previous vendor attempt may have cleared the terminator; ::SOCKET
+    # has no END indicator, so the text reply needs "\n" to complete.
+    scope.read_termination = "\n"
+    scope.query("*OPC?")                 # wait until the settings are applied
+    # No *OPC? after START — the image itself is the response, and
+    # read_raw() blocks until it arrives.
     scope.write("HARDcopy START")
-    time.sleep(2.0)
     scope.read_termination = None
     data = scope.read_raw()
     return data
@@ -568,14 +752,12 @@ def _dump_keysight(scope, color: str = "WHITE") -> bytes:
     color: "WHITE" -> INKS  |  "BLACK" -> SCR
     """
     scheme = "INKS" if color == "WHITE" else "SCR"
-    scope.write(f":DISP:DATA PNG,{scheme},COL")   # some older models omit args
-    time.sleep(0.5)
     scope.read_termination = None
     data = scope.query_binary_values(
         f":DISP:DATA? PNG,{scheme},COL",
         datatype="B",
         container=bytes,
-        delay=0.5,
+        chunk_size=_VISA_CHUNK_SIZE,
     )
     return bytes(data) if data else b""
 
@@ -591,49 +773,146 @@ def _dump_rigol(scope, color: str = "WHITE") -> bytes:
     # Best available: send color hint via the query argument where supported.
     arg = "OFF" if color == "WHITE" else "ON"
     scope.write(f":DISP:DATA? ON,{arg},PNG")
-    time.sleep(0.5)
     scope.read_termination = None
-    data = scope.read_raw()
+    data = scope.read_raw()              # blocks until the PNG block arrives
     if not data or len(data) < 10:
         # Fallback: plain query without color args (older firmware)
         scope.write(":DISP:DATA?")
-        time.sleep(0.5)
         data = scope.read_raw()
     return data
 
 
 # ══════════════════════════ Image utilities ══════════════════════════════════
 
-def _strip_ieee_block(data: bytes) -> bytes:
-    """Remove IEEE 488.2 definite-length block header  #N<N digits><data>."""
-    if data and data[0:1] == b"#":
-        try:
-            n_digits  = int(chr(data[1]))
-            byte_count = int(data[2 : 2 + n_digits])
-            data       = data[2 + n_digits : 2 + n_digits + byte_count]
-        except Exception:
-            pass
-    return data
+def _ieee_block_header(head: bytes | memoryview) -> tuple[int, int] | None:
+    """
+    Parse an IEEE 488.2 definite-length header "#N<N digits>" at the start
+    of *head*.  Returns (header length, declared byte count), or None if
+    *head* does not start with a valid header.
+    """
+    if head[:1] != b"#":
+        return None
+    try:
+        n_digits = int(chr(head[1]))
+        return 2 + n_digits, int(bytes(head[2 : 2 + n_digits]))
+    except (IndexError, ValueError):
+        return None
 
 
-def _save_image(image_data: bytes, save_path: str) -> None:
+def _ieee_block_writer(write: Callable[[memoryview], object]
+                       ) -> tuple[Callable[[memoryview], None], Callable[[], int]]:
+    """
+    Streaming counterpart of _strip_ieee_block(): wrap *write* so that an
+    IEEE 488.2 "#N<N digits>" header at the start of the stream is dropped
+    and anything past the declared byte count is ignored.  The header is
+    expected within the first chunk (VICP frames are far larger); if it
+    cannot be parsed, data is passed through unchanged.
+    Returns (writer, remaining) — remaining() is the number of declared
+    bytes not yet written (0 once complete, or when nothing was declared).
+    """
+    left: int | None = None   # bytes still expected; None = no limit
+    first = True
+
+    def _write(chunk: memoryview) -> None:
+        nonlocal left, first
+        if first:
+            first = False
+            block = _ieee_block_header(chunk)
+            if block:
+                hlen, left = block
+                chunk      = chunk[hlen:]
+        if left is not None:
+            chunk = chunk[:left]
+            left -= len(chunk)
+        if chunk:
+            write(chunk)
+
+    def _remaining() -> int:
+        return left or 0
+
+    return _write, _remaining
+
+
+def _strip_ieee_block(data: bytes) -> memoryview | None:
+    """
+    Remove IEEE 488.2 definite-length block header  #N<N digits><data>.
+    Returns a zero-copy memoryview onto *data* (the image can be ~1 MB),
+    or None if fewer bytes arrived than the header declares.
+    """
+    mv    = memoryview(data)
+    block = _ieee_block_header(data)
+    if block:
+        hlen, byte_count = block
+        mv = mv[hlen : hlen + byte_count]
+        if len(mv) < byte_count:
+            print(f"[ERROR] Image incomplete — {len(mv):,} bytes received, "
+                  f"{byte_count:,} declared by the block header.")
+            return None
+    return mv
+
+
+_PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+def _sniff_image(data: bytes | memoryview) -> tuple[str | None, int, int]:
+    """
+    Identify PNG / BMP from the magic bytes and read the dimensions from
+    the fixed-offset header — no decode.  Returns (ext, width, height),
+    or (None, 0, 0) for anything else.
+    """
+    if data[:8] == _PNG_MAGIC and len(data) >= 24:
+        w, h = struct.unpack(">II", data[16:24])      # IHDR width / height
+        return ".png", w, h
+    if data[:2] == b"BM" and len(data) >= 26:
+        w, h = struct.unpack("<ii", data[18:26])      # BITMAPINFOHEADER
+        return ".bmp", w, abs(h)                      # h < 0 = top-down BMP
+    return None, 0, 0
+
+
+def _print_saved(save_path: str, width: int, height: int) -> None:
+    print(f"\n{'='*60}")
+    print(f"  Screenshot saved  →  {save_path}")
+    print(f"  Dimensions        :  {width} × {height} px")
+    print(f"  File size         :  {os.path.getsize(save_path):,} bytes")
+    print(f"{'='*60}")
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _save_image(image_data: bytes | memoryview, save_path: str) -> None:
     out_dir = os.path.dirname(os.path.abspath(save_path))
     os.makedirs(out_dir, exist_ok=True)
 
+    # Already in the requested format (PNG → .png, BMP → .bmp): write the
+    # bytes as-is; decoding and re-encoding would only burn CPU.
+    ext = os.path.splitext(save_path)[1].lower()
+    fmt, width, height = _sniff_image(image_data)
+    if fmt is not None and fmt == ext:
+        with open(save_path, "wb") as fh:
+            fh.write(image_data)
+        _print_saved(save_path, width, height)
+        return
+
     if PILLOW_AVAILABLE:
         try:
-            img = Image.open(_io.BytesIO(image_data))
-            img.save(save_path)
-            print(f"\n{'='*60}")
-            print(f"  Screenshot saved  →  {save_path}")
-            print(f"  Dimensions        :  {img.size[0]} × {img.size[1]} px")
-            print(f"  File size         :  {os.path.getsize(save_path):,} bytes")
-            print(f"{'='*60}")
+            # Image.open() parses the header only; pixels are decoded lazily,
+            # and only img.save() (a real conversion) forces that decode.
+            with Image.open(_io.BytesIO(image_data)) as img:
+                width, height = img.size
+                if img.format == Image.registered_extensions().get(ext):
+                    with open(save_path, "wb") as fh:
+                        fh.write(image_data)
+                else:
+                    img.save(save_path)
+            _print_saved(save_path, width, height)
             return
         except Exception as exc:
             print(f"[WARN] Pillow decode failed ({exc}) — saving raw bytes.")
 
-    ext      = os.path.splitext(save_path)[1].lower()
     raw_path = save_path if ext == ".bmp" else os.path.splitext(save_path)[0] + ".bmp"
     with open(raw_path, "wb") as fh:
         fh.write(image_data)
@@ -678,9 +957,8 @@ def main() -> None:
     if CONNECTION_TYPE.upper() == "USB":
         print("=" * 60)
 
-        rm_probe = _open_rm()
-        resource = USB_RESOURCE if USB_RESOURCE else find_usb_resource(rm_probe)
-        rm_probe.close()
+        rm       = _open_rm()
+        resource = USB_RESOURCE if USB_RESOURCE else find_usb_resource(rm)
 
         if not resource:
             print("\n[FAIL] No USB resource available.")
@@ -708,13 +986,18 @@ def main() -> None:
             print("      Scope may still respond to VISA — continuing …")
 
         # Try native VICP first (LeCroy scopes configured in TCPIP/VICP mode)
-        success = vicp_capture(SCOPE_IP, save_path, TIMEOUT_SEC)
+        success, vicp_vendor = vicp_capture(SCOPE_IP, save_path, TIMEOUT_SEC)
 
-        # Fall back to VISA resource strings (VXI-11, HiSLIP, raw socket)
+        # Fall back to VISA resource strings (HiSLIP, VXI-11, raw socket).
+        # If VICP already identified a LeCroy, reuse that instead of
+        # paying another *IDN? round-trip on every candidate.
         if not success:
-            candidates = build_ethernet_resources(SCOPE_IP, SCOPE_PORT)
+            known_vendor = vicp_vendor if vicp_vendor == "LECROY" else None
+            candidates   = build_ethernet_resources(SCOPE_IP, SCOPE_PORT)
             for res in candidates:
-                success = scpi_capture(res, save_path, timeout_ms)
+                success = scpi_capture(res, save_path, timeout_ms,
+                                       open_timeout_ms=_ETH_OPEN_TIMEOUT_MS,
+                                       pre_detected_vendor=known_vendor)
                 if success:
                     break
 
@@ -31,15 +31,29 @@ SUBNET        = ""            # "" = auto-detect local /24
 # Ports checked on each host (standard SCPI instrument ports)
 SCPI_PORTS    = [5025, 1861, 80]
 
-# Number of parallel TCP threads (increase for faster scans on large subnets)
+# Number of threads running blocking *IDN? queries on ports found open
 MAX_WORKERS   = 64
 
+# Maximum simultaneous in-flight TCP connects during the async port sweep.
+# Each costs one socket (no thread); capped at run time to fit under the
+# OS open-file limit (RLIMIT_NOFILE) where that can be queried.
+MAX_CONNECTS  = 512
+
 # Per-host TCP connect timeout (seconds) — keep low for fast sweeps
 TCP_TIMEOUT   = 0.5
 
 # SCPI *IDN? read timeout after a port is found open (seconds)
 IDN_TIMEOUT   = 3
 
+# Skip dead hosts before the TCP sweep: hosts in the OS ARP cache plus those
+# answering one ICMP echo are scanned; the rest are dropped.  Only applied
+# to subnets on a directly attached Ethernet / Wi-Fi link (routed or VPN
+# subnets are always fully probed).  Needs the optional 'icmplib' package
+# and unprivileged ICMP — otherwise (or when False) every host is
+# TCP-probed as before.
+PING_SWEEP    = True
+PING_TIMEOUT  = 0.2           # seconds to wait for an echo reply
+
 # ── Output ───────────────────────────────────────────────────────────────── #
 # Set to a file path to save results as CSV, e.g. r"C:\captures\scan.csv"
 # Leave "" to print results to the console only.
@@ -49,14 +63,24 @@ CSV_OUTPUT    = ""
 #  Do NOT edit below this line unless you know what you are doing.
 # ═══════════════════════════════════════════════════════════════════════════ #
 
+import asyncio
+import atexit
 import csv
 import ipaddress
 import os
+import queue
+import re
+import select
 import socket
+import struct
+import subprocess
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain, islice
+from typing import Iterable
 
 # ── PyVISA (optional — needed only for USB scan) ──────────────────────────
 try:
@@ -65,6 +89,45 @@ try:
 except ImportError:
     PYVISA_AVAILABLE = False
 
+# ── icmplib (optional — ICMP ping pre-sweep of the Ethernet scan) ────────
+try:
+    from icmplib import multiping
+except ImportError:
+    multiping = None
+
+# ── pyahocorasick (optional — faster vendor detection on bulk IDN lists) ──
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# ── Event loop for the async Ethernet sweep ───────────────────────────────
+# Windows: IOCP proactor handles thousands of overlapping connects natively.
+# Elsewhere: uvloop (libuv) if installed, else the stock selector loop.
+if sys.platform == "win32":
+    _new_event_loop = asyncio.ProactorEventLoop
+else:
+    try:
+        import uvloop
+        _new_event_loop = uvloop.new_event_loop
+    except ImportError:
+        _new_event_loop = asyncio.new_event_loop
+
+
+# Heavy enumeration results (VISA backend, NIC list) are reused for this long
+_CACHE_TTL  = 30.0                # seconds
+_RM_CACHE   = [None, 0.0]         # [ResourceManager, time.monotonic() opened]
+
+
+def _close_cached_rm() -> None:
+    rm = _RM_CACHE[0]
+    _RM_CACHE[:] = [None, 0.0]
+    if rm is not None:
+        try:
+            rm.close()
+        except Exception:
+            pass
+
 
 def _open_rm() -> "pyvisa.ResourceManager":
     """
@@ -75,23 +138,49 @@ def _open_rm() -> "pyvisa.ResourceManager":
          — required to see devices that appear as IVI in Device Manager.
       2. pyvisa-py pure-Python backend (@py)
          — fallback for machines without a system VISA installation.
+
+    The manager is cached for _CACHE_TTL seconds and closed at exit, so
+    callers must NOT close it.
     """
+    rm, opened = _RM_CACHE
+    if rm is not None and time.monotonic() - opened < _CACHE_TTL:
+        return rm
+    _close_cached_rm()
     try:
         rm = pyvisa.ResourceManager()   # uses system VISA (NI / Keysight / IVI)
-        rm.list_resources()             # quick test — raises if backend unusable
-        return rm
-    except Exception:
-        pass
-    return pyvisa.ResourceManager("@py")
+    except (OSError, ValueError):       # no / unloadable system VISA library
+        rm = pyvisa.ResourceManager("@py")
+    _RM_CACHE[:] = [rm, time.monotonic()]
+    return rm
+
+
+atexit.register(_close_cached_rm)
 
 
 # ══════════════════════════ Helpers ══════════════════════════════════════════
 
+_SUBNET_CACHE = [None, 0.0]       # [list of (label, cidr), time.monotonic()]
+
+
 def get_all_subnets() -> list[tuple[str, str]]:
     """
     Return a list of (interface_name, subnet_cidr) for every active
     IPv4 NIC — covering Wi-Fi, LAN, VPN adapters, etc.
 
+    NIC enumeration is cached for _CACHE_TTL seconds; repeated scans in
+    the same process reuse it.
+    """
+    subnets, stamp = _SUBNET_CACHE
+    if subnets is None or time.monotonic() - stamp >= _CACHE_TTL:
+        subnets = _enumerate_subnets()
+        _SUBNET_CACHE[:] = [subnets, time.monotonic()]
+    return list(subnets)
+
+
+def _enumerate_subnets() -> list[tuple[str, str]]:
+    """
+    Uncached worker for get_all_subnets().
+
     Falls back to a single UDP-trick detection when socket.getaddrinfo
     cannot enumerate interfaces (rare).
     Returns list of (label, '192.168.x.0/24') tuples.
@@ -159,113 +248,473 @@ def get_all_subnets() -> list[tuple[str, str]]:
         sys.exit(1)
 
 
-def tcp_probe(ip: str, port: int, timeout: float) -> bool:
-    """Return True if *ip*:*port* accepts a TCP connection."""
+_LINGER_RST = struct.pack("ii", 1, 0)   # l_onoff=1, l_linger=0 → close() sends RST
+_PROBE_BUF  = 4096                      # SO_RCVBUF/SO_SNDBUF — an IDN reply is ~60 B
+
+
+def _shrink_buffers(s: socket.socket) -> None:
+    """
+    Cap kernel socket buffers at _PROBE_BUF: thousands of concurrent
+    probes then cost a few KB each instead of the OS default ~128 KB.
+    """
     try:
-        with socket.create_connection((ip, port), timeout=timeout):
-            return True
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _PROBE_BUF)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _PROBE_BUF)
     except OSError:
+        pass   # OS may refuse the size — default buffers still work
+
+def _set_user_timeout(s: socket.socket, seconds: float) -> None:
+    """
+    Linux only: abort the connection once sent data stays unacknowledged
+    for *seconds*, instead of retransmitting for the kernel default ~20 s.
+    """
+    if hasattr(socket, "TCP_USER_TIMEOUT"):
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, int(seconds * 1000))
+
+
+async def tcp_connect(ip: str, port: int, timeout: float) -> socket.socket | None:
+    """
+    Open a TCP connection to *ip*:*port*; return the connected socket, or
+    None if it is refused / times out.  The caller owns (closes) the socket.
+    Non-blocking connect() driven by the event loop (epoll / kqueue /
+    IOCP) — thousands can be in flight at once, each costing only an fd.
+    close() resets the connection (zero linger), so swept sockets skip
+    TIME_WAIT and don't exhaust ephemeral ports on large or repeated scans.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    except OSError:
+        return None   # e.g. EMFILE — count the port as closed, don't abort the sweep
+    try:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RST)
+        _set_user_timeout(s, timeout)
+    except OSError:
+        pass   # tuning only — an unsupported option mustn't mark the port closed
+    _shrink_buffers(s)   # before connect(), so the SYN advertises the small window
+    try:
+        s.setblocking(False)
+        await asyncio.wait_for(loop.sock_connect(s, (ip, port)), timeout)
+    except (OSError, asyncio.TimeoutError):
+        s.close()
+        return None
+    except BaseException:   # cancelled — don't leak the fd
+        s.close()
+        raise
+    return s
+
+
+async def tcp_probe(ip: str, port: int, timeout: float) -> bool:
+    """Return True if *ip*:*port* accepts a TCP connection."""
+    s = await tcp_connect(ip, port, timeout)
+    if s is None:
         return False
+    s.close()
+    return True
 
 
-def query_idn(ip: str, port: int, timeout: float) -> str:
+def query_idn(ip: str, port: int, timeout: float,
+              connect_timeout: float = TCP_TIMEOUT) -> str:
     """
     Send *IDN? over a raw TCP socket and return the stripped response.
     Works for plain SCPI-over-TCP (port 5025).  Returns "" on failure.
+    The TCP handshake gets the short *connect_timeout*; the read is
+    bounded by *timeout*, so a slow instrument may take its time but a
+    dead host fails fast.
     """
     try:
-        with socket.create_connection((ip, port), timeout=timeout) as s:
-            s.settimeout(timeout)
-            s.sendall(b"*IDN?\n")
-            time.sleep(0.2)
-            chunks = []
-            while True:
-                try:
-                    chunk = s.recv(4096)
-                    if not chunk:
-                        break
-                    chunks.append(chunk)
-                    if b"\n" in chunk:
-                        break
-                except socket.timeout:
+        with socket.create_connection((ip, port), timeout=connect_timeout) as s:
+            return query_idn_on(s, timeout)
+    except Exception:
+        return ""
+
+
+def query_idn_on(s: socket.socket, timeout: float) -> str:
+    """
+    Send *IDN? on an already-connected socket *s* (e.g. the one left open
+    by a successful probe, saving a second handshake) and return the
+    stripped response, or "" on failure.  The socket is non-blocking for
+    the read phase and select() is only entered when nothing is waiting,
+    so reading starts the moment the first byte lands; bytes are
+    received straight into one buffer that doubles when full.  Whatever
+    arrived before the *timeout* deadline (or the peer closing) is
+    returned, terminated by a newline or not.
+    """
+    try:
+        s.settimeout(timeout)
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)   # no Nagle delay
+        _shrink_buffers(s)
+        try:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, "TCP_KEEPIDLE"):   # probe a silent peer after 1 s
+                s.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 1)
+                s.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 1)
+                s.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 2)
+            _set_user_timeout(s, timeout)
+        except OSError:
+            pass   # older stacks lack per-socket keepalive tuning
+        s.sendall(b"*IDN?\n")
+        s.setblocking(False)   # recv raises BlockingIOError instead of waiting
+        deadline = time.monotonic() + timeout
+        buf      = bytearray(_PROBE_BUF)
+        off      = 0
+        while True:
+            if off == len(buf):
+                buf.extend(bytes(len(buf)))
+            try:
+                with memoryview(buf) as mv:
+                    n = s.recv_into(mv[off:])
+            except BlockingIOError:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     break
-            return b"".join(chunks).decode("ascii", errors="replace").strip()
+                readable, _, _ = select.select([s], [], [], remaining)
+                if not readable:
+                    break   # total IDN_TIMEOUT budget used up
+                continue
+            except OSError:
+                break   # reset by peer — keep what already arrived
+            if not n:
+                break
+            off += n
+            if buf.find(b"\n", off - n, off) >= 0:
+                break
+        return buf[:off].decode("ascii", errors="replace").strip()
     except Exception:
         return ""
 
 
+_VENDOR_NAMES = {
+    "LECROY"   : "LeCroy / Teledyne",
+    "TELEDYNE" : "LeCroy / Teledyne",
+    "TEKTRONIX": "Tektronix",
+    "KEYSIGHT" : "Keysight / Agilent",
+    "AGILENT"  : "Keysight / Agilent",
+    "RIGOL"    : "Rigol",
+    "SIGLENT"  : "Siglent",
+    "ROHDE"    : "Rohde & Schwarz",
+    "NATIONAL" : "National Instruments",
+    "NI"       : "National Instruments",
+}
+# "NI" only as a whole word, so e.g. "UNIT" or "SINIC" don't alias it
+_VENDOR_RE = re.compile(
+    "|".join(rf"\b{t}\b" if t == "NI" else re.escape(t) for t in _VENDOR_NAMES),
+    re.IGNORECASE)
+
+# Same table as an Aho-Corasick automaton: one pass over the IDN for all
+# tokens at once.  Values are (token length, whole-word only, vendor name).
+_VENDOR_AC = None
+if ahocorasick is not None:
+    _VENDOR_AC = ahocorasick.Automaton()
+    for _tag, _name in _VENDOR_NAMES.items():
+        _VENDOR_AC.add_word(_tag, (len(_tag), _tag == "NI", _name))
+    _VENDOR_AC.make_automaton()
+
+
+def _is_word_at(s: str, start: int, end: int) -> bool:
+    """True if s[start:end] is not glued to a letter/digit on either side."""
+    return ((start == 0 or not s[start - 1].isalnum()) and
+            (end == len(s) or not s[end].isalnum()))
+
+
 def detect_vendor(idn: str) -> str:
-    u = idn.upper()
-    if "LECROY" in u or "TELEDYNE" in u:
-        return "LeCroy / Teledyne"
-    if "TEKTRONIX" in u:
-        return "Tektronix"
-    if "KEYSIGHT" in u or "AGILENT" in u:
-        return "Keysight / Agilent"
-    if "RIGOL" in u:
-        return "Rigol"
-    if "SIGLENT" in u:
-        return "Siglent"
-    if "ROHDE" in u:
-        return "Rohde & Schwarz"
-    if "NATIONAL" in u or "NI" in u:
-        return "National Instruments"
-    if idn:
-        return "Unknown"
-    return ""
-
-
-def scan_host(ip: str) -> dict | None:
+    """
+    Map an *IDN? reply to a display vendor name in one scan (Aho-Corasick
+    when pyahocorasick is installed, else one regex); the first token
+    found wins, i.e. the manufacturer field.
+    """
+    if _VENDOR_AC is not None:
+        u = idn.upper()
+        for last, (n, whole_word, name) in _VENDOR_AC.iter(u):
+            if not whole_word or _is_word_at(u, last + 1 - n, last + 1):
+                return name
+    else:
+        m = _VENDOR_RE.search(idn)
+        if m:
+            return _VENDOR_NAMES[m.group(0).upper()]
+    return "Unknown" if idn else ""
+
+
+async def scan_host(ip: str, sem: asyncio.Semaphore,
+                    pool: ThreadPoolExecutor) -> dict | None:
     """
     Probe a single host.  Returns a result dict ONLY if a valid *IDN?
     response is received, otherwise None.
+    *sem* caps in-flight connects; the blocking *IDN? query runs on *pool*.
+
+    All SCPI_PORTS are probed at once, so a filtered host costs one
+    TCP_TIMEOUT rather than one per port.  Results are still consumed in
+    SCPI_PORTS priority order; outstanding probes are cancelled as soon
+    as an instrument answers.  On the SCPI ports the probe's connection
+    is kept open and reused for *IDN? — no second handshake.
     """
-    for port in SCPI_PORTS:
-        if not tcp_probe(ip, port, TCP_TIMEOUT):
-            continue
-        # Try IDN on port 5025 (plain SCPI) or 1861 (VICP)
-        idn = query_idn(ip, port, IDN_TIMEOUT) if port in (5025, 1861) else ""
-        if not idn:
-            continue   # port responded but not a SCPI instrument — skip
-        vendor = detect_vendor(idn)
-        return {
-            "type"    : "ETHERNET",
-            "address" : ip,
-            "port"    : port,
-            "idn"     : idn,
-            "vendor"  : vendor or "Unknown",
-            "resource": f"TCPIP::{ip}::inst0::INSTR",
-        }
-    return None
+    loop = asyncio.get_running_loop()
+
+    async def probe(port: int) -> socket.socket | bool:
+        async with sem:
+            if port in (5025, 1861):
+                return await tcp_connect(ip, port, TCP_TIMEOUT)
+            return await tcp_probe(ip, port, TCP_TIMEOUT)   # probe-only port
+
+    probes = {port: asyncio.ensure_future(probe(port)) for port in SCPI_PORTS}
+    try:
+        for port in SCPI_PORTS:
+            conn = await probes[port]
+            if not conn:
+                continue
+            # Try IDN on port 5025 (plain SCPI) or 1861 (VICP)
+            if isinstance(conn, socket.socket):
+                idn = await loop.run_in_executor(pool, query_idn_on, conn, IDN_TIMEOUT)
+                conn.close()
+            else:
+                idn = ""
+            if not idn:
+                continue   # port responded but not a SCPI instrument — skip
+            vendor = detect_vendor(idn)
+            return {
+                "type"    : "ETHERNET",
+                "address" : ip,
+                "port"    : port,
+                "idn"     : idn,
+                "vendor"  : vendor or "Unknown",
+                "resource": f"TCPIP::{ip}::inst0::INSTR",
+            }
+        return None
+    finally:
+        for task in probes.values():
+            task.cancel()
+            if task.done() and not task.cancelled():
+                conn = task.result()
+                if isinstance(conn, socket.socket):
+                    conn.close()    # opened but never used
 
 
 # ══════════════════════════ Ethernet scan ════════════════════════════════════
 
+def _run_async(coro):
+    """
+    Run *coro* to completion on a fresh _new_event_loop() and close it —
+    asyncio.run() without touching the global loop policy, so the sweep
+    can run from a worker thread.
+    """
+    loop = _new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+_REDRAW_SEC     = 0.05               # progress bar redraw interval (≤ 20 Hz)
+_FD_RESERVE     = 64                 # fds kept free for stdio, VISA, CSV, …
+_PING_MAX_HOSTS = 65534              # larger subnets skip the ping pre-sweep
+_BARS           = ["█" * i + "░" * (50 - i) for i in range(51)]   # bar per 2 %
+
+
+def _connect_limit() -> int:
+    """
+    MAX_CONNECTS, capped so that the connects plus the sockets held for
+    *IDN? and the connected ones waiting their turn stay under the soft
+    open-file limit (e.g. 256 by default on macOS).
+    """
+    try:
+        import resource
+        soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    except (ImportError, OSError, ValueError):
+        return MAX_CONNECTS   # Windows: no per-process fd rlimit to honour
+    if soft == resource.RLIM_INFINITY:
+        return MAX_CONNECTS
+    return max(1, min(MAX_CONNECTS, (soft - _FD_RESERVE - MAX_WORKERS) // 2))
+
+
+def _arp_cached_hosts() -> set[str]:
+    """
+    Return the IPv4 addresses holding a complete entry in the OS ARP
+    table — those hosts answered recently and are definitely up.
+    """
+    ips = set()
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/net/arp", encoding="ascii") as fh:
+                next(fh)   # header line
+                for line in fh:
+                    fields = line.split()
+                    # flags 0x0 = incomplete entry (no reply received)
+                    if len(fields) >= 4 and fields[2] != "0x0":
+                        ips.add(fields[0])
+        else:
+            out = subprocess.run(["arp", "-a"], capture_output=True,
+                                 text=True, timeout=2).stdout
+            ips.update(re.findall(r"\b\d{1,3}(?:\.\d{1,3}){3}\b", out))
+    except Exception:
+        pass
+    return ips
+
+
+def _on_link_networks() -> list[ipaddress.IPv4Network]:
+    """
+    IPv4 networks of the active NICs that carry a link-layer (MAC)
+    address — the only ones whose hosts resolve via ARP.  Routed subnets
+    and point-to-point VPN tunnels are not included.  Without psutil the
+    link type is unknown and get_all_subnets() is used as is.
+    """
+    try:
+        import psutil
+    except ImportError:
+        return [ipaddress.IPv4Network(cidr) for _, cidr in get_all_subnets()]
+
+    link_families = {getattr(psutil, "AF_LINK", None), getattr(socket, "AF_PACKET", None)}
+    stats = psutil.net_if_stats()
+    nets  = []
+    for iface, addrs in psutil.net_if_addrs().items():
+        st = stats.get(iface)
+        if not st or not st.isup:
+            continue
+        # a MAC of all zeros (or none at all) = no ARP on this interface
+        if not any(a.family in link_families and (a.address or "").strip("0:-")
+                   for a in addrs):
+            continue
+        for a in addrs:
+            if a.family == socket.AF_INET and a.netmask and not a.address.startswith("127."):
+                nets.append(ipaddress.IPv4Network(f"{a.address}/{a.netmask}", strict=False))
+    return nets
+
+
+def ping_sweep(hosts: list[str]) -> list[str] | None:
+    """
+    Return the subset of *hosts* that is alive (ARP-cached or answering
+    an ICMP echo), in the original order — or None when the sweep is
+    disabled or not possible (icmplib missing, no ICMP permission), in
+    which case the caller must TCP-probe every host.
+
+    The ARP table is read again after pinging: an on-link host that drops
+    echo requests (e.g. a Windows-based scope behind its firewall) still
+    answers the ARP resolution the ping triggers, so it is kept.
+    """
+    if not PING_SWEEP or multiping is None:
+        return None
+
+    alive   = _arp_cached_hosts()
+    unknown = [h for h in hosts if h not in alive]
+    if unknown:
+        try:
+            replies = multiping(unknown, count=1, timeout=PING_TIMEOUT,
+                                concurrent_tasks=256, privileged=False)
+        except Exception:
+            return None   # e.g. unprivileged ICMP not permitted
+        alive.update(r.address for r in replies if r.is_alive)
+        alive.update(_arp_cached_hosts())
+    return [h for h in hosts if h in alive]
+
+
+def _render_progress(found_q: queue.SimpleQueue, progress: list, total: int) -> None:
+    """
+    Consumer thread: print a [FOUND] line for each result put on
+    *found_q* and redraw the bar from *progress*[0] (hosts done) every
+    _REDRAW_SEC, until the None sentinel arrives.  Keeps all stdout
+    writes off the event loop thread.
+    """
+    found = 0
+    drawn = -1
+    while True:
+        try:
+            r = found_q.get(timeout=_REDRAW_SEC)
+        except queue.Empty:
+            r = False   # timer tick — redraw only
+        if r:
+            found += 1
+            print(f"\r  [FOUND] {r['address']}:{r['port']}  {r['vendor']}  {r['idn'][:60]}")
+        done = progress[0]
+        if r or done != drawn:
+            drawn = done
+            pct = done / total * 100 if total else 100.0
+            print(f"\r  [{_BARS[int(pct / 2)]}] {pct:5.1f}%  found: {found}", end="", flush=True)
+        if r is None:
+            return
+
+
+async def _scan_hosts_async(hosts: Iterable[str], total: int) -> list[dict]:
+    """
+    Sweep *hosts* (any iterable of *total* addresses, consumed lazily) on
+    one event loop.  Connects are capped by _connect_limit() and at most
+    twice that many host tasks exist at once, so memory stays flat however
+    large the subnet is.  The loop only counts completions and queues
+    results; _render_progress draws the bar from a separate thread.  If
+    the sweep aborts, outstanding host tasks are cancelled.
+    """
+    hosts    = iter(hosts)
+    pending  = set()
+    results  = []
+    progress = [0]   # hosts done; written here, read by the render thread
+    found_q  = queue.SimpleQueue()
+    render   = threading.Thread(target=_render_progress,
+                                args=(found_q, progress, total), daemon=True)
+    render.start()
+
+    limit    = _connect_limit()
+    inflight = limit * 2   # scan_host tasks alive at any one time
+    sem      = asyncio.Semaphore(limit)
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            try:
+                while True:
+                    for h in islice(hosts, inflight - len(pending)):
+                        pending.add(asyncio.ensure_future(scan_host(h, sem, pool)))
+                    if not pending:
+                        break
+                    finished, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in finished:
+                        result = task.result()
+                        progress[0] += 1
+                        if result:
+                            results.append(result)
+                            found_q.put(result)
+            finally:
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+    finally:
+        found_q.put(None)   # sentinel: final redraw, then exit
+        render.join()
+    return results
+
+
+def _subnet_hosts(network: ipaddress.IPv4Network,
+                  tag: str = "") -> tuple[Iterable[str], int]:
+    """
+    Return (hosts, count) for *network*: a lazy iterable of host
+    addresses, pruned by the ping pre-sweep when it is available.  Only
+    on-link networks are pruned: elsewhere the ARP table can't vouch for
+    hosts that drop ICMP echo, so every host is probed.
+    """
+    hosts = (str(h) for h in network.hosts())
+    # /31 and /32 have no network/broadcast address to exclude
+    total = network.num_addresses - (2 if network.prefixlen < 31 else 0)
+
+    if PING_SWEEP and multiping is not None and total <= _PING_MAX_HOSTS:
+        if not any(network.subnet_of(n) for n in _on_link_networks()):
+            print(f"\n[ETH] {tag}{network} is not on a local link — "
+                  f"ping pre-sweep skipped, probing every host.")
+            return hosts, total
+        hosts = list(hosts)
+        alive = ping_sweep(hosts)
+        if alive is not None:
+            print(f"\n[ETH] {tag}Ping sweep {network}: {len(alive)}/{total} host(s) alive")
+            hosts = alive
+            total = len(alive)
+    return hosts, total
+
+
 def scan_ethernet(subnet: str, label: str = "") -> list[dict]:
-    network = ipaddress.IPv4Network(subnet, strict=False)
-    hosts   = list(network.hosts())
-    total   = len(hosts)
-    tag     = f"{label} " if label else ""
+    network      = ipaddress.IPv4Network(subnet, strict=False)
+    tag          = f"{label} " if label else ""
+    hosts, total = _subnet_hosts(network, tag)
 
     print(f"\n[ETH] {tag}Scanning {subnet}  ({total} hosts) …")
 
-    results  = []
-    done     = 0
-    found    = 0
-
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
-        futures = {pool.submit(scan_host, str(h)): str(h) for h in hosts}
-        for future in as_completed(futures):
-            done += 1
-            pct = done / total * 100
-            bar = "█" * int(pct / 2) + "░" * (50 - int(pct / 2))
-            print(f"\r  [{bar}] {pct:5.1f}%  found: {found}", end="", flush=True)
-            result = future.result()
-            if result:
-                found += 1
-                results.append(result)
-                print(f"\r  [FOUND] {result['address']}:{result['port']}  {result['vendor']}  {result['idn'][:60]}")
-                print(f"\r  [{bar}] {pct:5.1f}%  found: {found}", end="", flush=True)
+    results = _run_async(_scan_hosts_async(hosts, total))
 
     print()   # newline after progress bar
     return results
@@ -273,22 +722,70 @@ def scan_ethernet(subnet: str, label: str = "") -> list[dict]:
 
 def scan_all_ethernet(subnets: list[tuple[str, str]]) -> list[dict]:
     """
-    Scan every subnet in *subnets* sequentially (each with its own
-    parallel host sweep).  De-duplicates by IP so overlapping adapters
-    don't report the same instrument twice.
+    Scan every subnet in *subnets* in ONE sweep with a single progress
+    bar, so a multi-homed host waits for the slowest subnet rather than
+    the sum of all of them.  Subnets contained in another one (e.g. two
+    adapters on the same LAN) are scanned once; results are still
+    de-duplicated by IP.
     """
+    networks = {}   # network -> label, first adapter wins
+    for label, cidr in subnets:
+        networks.setdefault(ipaddress.IPv4Network(cidr, strict=False), label)
+    # CIDR blocks either nest or are disjoint — drop the nested ones
+    networks = {n: lbl for n, lbl in networks.items()
+                if not any(n != o and n.subnet_of(o) for o in networks)}
+
+    sources = []
+    total   = 0
+    for network, label in networks.items():
+        hosts, count = _subnet_hosts(network, f"{label} " if label else "")
+        sources.append(hosts)
+        total += count
+        print(f"\n[ETH] {label}  {network}  ({count} hosts)")
+
+    print(f"\n[ETH] Scanning {len(networks)} subnet(s)  ({total} hosts) …")
+    results = _run_async(_scan_hosts_async(chain.from_iterable(sources), total))
+    print()   # newline after progress bar
+
     all_results = []
     seen_ips    = set()
-    for label, cidr in subnets:
-        for r in scan_ethernet(cidr, label):
-            if r["address"] not in seen_ips:
-                seen_ips.add(r["address"])
-                all_results.append(r)
+    for r in results:
+        if r["address"] not in seen_ips:
+            seen_ips.add(r["address"])
+            all_results.append(r)
     return all_results
 
 
 # ══════════════════════════ USB scan ═════════════════════════════════════════
 
+def _usb_query(rm: "pyvisa.ResourceManager", res: str) -> tuple[dict | None, list[str]]:
+    """
+    Open one USB resource and query *IDN?.
+    Returns (entry_or_None, log_lines) so several devices can be queried
+    from worker threads and their logs merged afterwards, in order.
+    """
+    idn = ""
+    try:
+        inst = rm.open_resource(res, open_timeout=IDN_TIMEOUT * 1000)
+        inst.timeout = IDN_TIMEOUT * 1000
+        idn  = inst.query("*IDN?").strip()
+        inst.close()
+    except Exception as exc:
+        return None, [f"  [USB] {res} — open/IDN failed: {exc}"]
+    if not idn:
+        return None, [f"  [USB] {res} — no IDN response, skipped."]
+    vendor = detect_vendor(idn)
+    entry = {
+        "type"    : "USB",
+        "address" : res,
+        "port"    : "USB-TMC",
+        "idn"     : idn,
+        "vendor"  : vendor or "Unknown",
+        "resource": res,
+    }
+    return entry, [f"  [FOUND] USB  {vendor}  {idn[:70]}"]
+
+
 def scan_usb() -> tuple[list[dict], list[str]]:
     """
     Scan USB-TMC instruments via PyVISA.
@@ -305,53 +802,32 @@ def scan_usb() -> tuple[list[dict], list[str]]:
     rm = _open_rm()
     log.append(f"[USB] VISA backend: {rm.visalib}")
 
-    # Collect USB resources — LeCroy IVI uses ::INST, standard VISA uses ::INSTR
-    usb_resources = []
-    for pattern in ("USB?*::INSTR", "USB?*::INST", "USB?*"):
-        try:
-            found = list(rm.list_resources(pattern))
-            for r in found:
-                if r not in usb_resources:
-                    usb_resources.append(r)
-        except Exception as exc:
-            log.append(f"[USB] list_resources('{pattern}') failed: {exc}")
-        if usb_resources:
-            break   # stop at first pattern that yields results
+    # Collect USB resources — LeCroy IVI uses ::INST, standard VISA uses ::INSTR.
+    # One "USB?*" enumeration covers both; the suffix filter drops the ::RAW
+    # and other non-instrument sessions the bare glob also returns.
+    try:
+        found = rm.list_resources("USB?*")
+    except Exception as exc:
+        log.append(f"[USB] list_resources('USB?*') failed: {exc}")
+        found = ()
+    usb_resources = list(dict.fromkeys(
+        r for r in found if r.upper().endswith(("::INSTR", "::INST"))))
 
     if not usb_resources:
         log.append("[USB] No USB-TMC devices detected.")
-        rm.close()
         return [], log
 
     log.append(f"[USB] {len(usb_resources)} USB device(s) enumerated — querying IDN …")
     results = []
 
-    for res in usb_resources:
-        idn = ""
-        try:
-            inst = rm.open_resource(res, open_timeout=IDN_TIMEOUT * 1000)
-            inst.timeout = IDN_TIMEOUT * 1000
-            idn  = inst.query("*IDN?").strip()
-            inst.close()
-        except Exception as exc:
-            log.append(f"  [USB] {res} — open/IDN failed: {exc}")
-            continue
-        if not idn:
-            log.append(f"  [USB] {res} — no IDN response, skipped.")
-            continue
-        vendor = detect_vendor(idn)
-        entry = {
-            "type"    : "USB",
-            "address" : res,
-            "port"    : "USB-TMC",
-            "idn"     : idn,
-            "vendor"  : vendor or "Unknown",
-            "resource": res,
-        }
-        log.append(f"  [FOUND] USB  {vendor}  {idn[:70]}")
-        results.append(entry)
-
-    rm.close()
+    # Devices are independent VISA sessions: query them concurrently so the
+    # scan costs the slowest open+*IDN?, not the sum of all of them.
+    with ThreadPoolExecutor(max_workers=min(8, len(usb_resources))) as pool:
+        for entry, lines in pool.map(lambda res: _usb_query(rm, res), usb_resources):
+            log.extend(lines)
+            if entry:
+                results.append(entry)
+
     return results, log
 
 
@@ -359,17 +835,15 @@ def scan_usb() -> tuple[list[dict], list[str]]:
 
 COLUMNS = ["type", "address", "port", "vendor", "idn", "resource"]
 COL_W   = [9, 17, 8, 22, 52, 42]
-
-
-def _row(values: list, widths: list) -> str:
-    return "  ".join(str(v).ljust(w)[:w] for v, w in zip(values, widths))
+# one template per row: each column str()-ed, padded and cut to its width
+ROW_FMT = "  ".join(f"{{!s:<{w}.{w}}}" for w in COL_W)
 
 
 def print_results(results: list[dict]) -> None:
     if not results:
         return
 
-    header = _row(["TYPE", "ADDRESS", "PORT", "VENDOR", "IDN", "VISA RESOURCE"], COL_W)
+    header = ROW_FMT.format("TYPE", "ADDRESS", "PORT", "VENDOR", "IDN", "VISA RESOURCE")
     sep    = "  ".join("─" * w for w in COL_W)
 
     print(f"\n{'═'*120}")
@@ -378,19 +852,22 @@ def print_results(results: list[dict]) -> None:
     print(f"  {header}")
     print(f"  {sep}")
     for r in results:
-        row = _row([r["type"], r["address"], str(r["port"]),
-                    r["vendor"], r["idn"], r["resource"]], COL_W)
-        print(f"  {row}")
+        print("  " + ROW_FMT.format(r["type"], r["address"], r["port"],
+                                    r["vendor"], r["idn"], r["resource"]))
     print(f"{'═'*120}")
     print(f"\n  Total found: {len(results)} instrument(s)")
 
 
 def save_csv(results: list[dict], path: str) -> None:
-    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    folder = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(folder):
+        os.makedirs(folder, exist_ok=True)
     with open(path, "w", newline="", encoding="utf-8") as fh:
-        writer = csv.DictWriter(fh, fieldnames=COLUMNS)
-        writer.writeheader()
-        writer.writerows(results)
+        writer = csv.writer(fh)
+        writer.writerow(COLUMNS)
+        writer.writerows([r[c] for c in COLUMNS] for r in results)
+        fh.flush()
+        os.fsync(fh.fileno())   # one sync: the file is complete on disk
     print(f"\n  CSV saved  →  {path}")
 
 